@@ -2,14 +2,182 @@ import logging
 from .model import ApiType, EditableAttributesResponse, MediaResultItem, Response, ResponseType, StreamType
 
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from typing import Any, Optional, Type
 
-import requests
-
 BASE_URL: str = "https://api.nexx.cloud/v3.1/"
 OMNIA_HEADER_X_REQUEST_CID: str = "X-Request-CID"
 OMNIA_HEADER_X_REQUEST_TOKEN: str = "X-Request-Token"
+RETRY_TOTAL: int = 5
+RETRY_BACKOFF_FACTOR: float = 0.3
+RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504)
+RETRY_METHODS: frozenset[str] = frozenset(["GET", "PUT"])
+"""
+POST is left out on purpose: `upload_by_url` creates a new media item on each
+call, retrying it after the server already acted would create duplicates.
+"""
+RESPONSE_CACHE_SIZE: int = 128
+
+_EMPTY: dict[str, str] = {}
+"""Shared empty parameters, must never be mutated."""
+
+try:
+    import orjson
+
+    def _dump_json(obj: Any) -> bytes:
+        """Serializes a JSON request body, using orjson if it's installed."""
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _dump_json(obj: Any) -> bytes:
+        """Serializes a JSON request body, using orjson if it's installed."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+_RESPONSE_CLS: dict[Any, type[Response[Any]]] = {
+    MediaResultItem: Response[MediaResultItem],
+    EditableAttributesResponse: Response[EditableAttributesResponse],
+    Any: Response[Any],
+}
+
+
+def _response_class(response_type: Any) -> type[Response[Any]]:
+    """Returns the parametrized `Response` model for a given result type."""
+    return (
+        _RESPONSE_CLS.get(response_type)
+        or Response[response_type]  # type: ignore[valid-type]
+    )
+
+
+_CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _build_url(
+    base: str,
+    api_type: ApiType,
+    stream_type: StreamType,
+    operation: str,
+    args: list[str],
+) -> str:
+    if not args:
+        args_path = ""
+    elif len(args) == 1:
+        args_path = f"/{args[0]}"
+    else:
+        args_path = "/" + "/".join(args)
+    if api_type is ApiType.MEDIA:
+        return f"{base}{stream_type.value}/{operation}{args_path}"
+    elif api_type is ApiType.MANAGEMENT:
+        return f"{base}manage/{stream_type.value}{args_path}/{operation}"
+    elif api_type is ApiType.UPLOAD_LINK_MANAGEMENT:
+        return f"{base}manage/uploadlinks/{operation}"
+    elif api_type is ApiType.SYSTEM:
+        return f"{base}system/{operation}{args_path}"
+    return ""
+
+
+def _request_header(
+    sig_cache: dict[str, str],
+    operation: str,
+    domain_id_enc: bytes,
+    api_secret_enc: bytes,
+) -> dict[str, str]:
+    token = sig_cache.get(operation)
+    if token is None:
+        signature = hashlib.md5()
+        signature.update(operation.encode("utf-8"))
+        signature.update(domain_id_enc)
+        signature.update(api_secret_enc)
+        token = signature.hexdigest()
+        sig_cache[operation] = token
+    return {
+        OMNIA_HEADER_X_REQUEST_TOKEN: token,
+    }
+
+
+def _request_body(
+    header: dict[str, str],
+    parameters: dict[str, str],
+    json_body: Optional[dict[str, Any]],
+) -> Any:
+    """Returns the request body, sets the content type on `header` if needed."""
+    if json_body is not None:
+        header["Content-Type"] = "application/json"
+        return _dump_json(json_body)
+    # Avoid sending an empty form body.
+    return parameters or None
+
+
+def _min_interval(rate_limit_per_sec: Optional[float]) -> Optional[float]:
+    if rate_limit_per_sec is None:
+        return None
+    if rate_limit_per_sec <= 0:
+        raise ValueError(
+            f"rate_limit_per_sec must be greater than 0, got {rate_limit_per_sec}")
+    return 1 / rate_limit_per_sec
+
+
+class _ResponseCache:
+    """
+    LRU cache of parsed GET results along with their ETag, holding at most `size`
+    entries. A `size` of 0 disables caching.
+    """
+
+    def __init__(self, size: int):
+        if size < 0:
+            raise ValueError(f"cache_size must not be negative, got {size}")
+        self._size = size
+        self._entries: OrderedDict[_CacheKey, tuple[str, Response[Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, method: str, url: str, parameters: dict[str, str]) -> Optional[_CacheKey]:
+        """Only GET results are cached, keyed by the URL and the parameters."""
+        if self._size == 0 or method.lower() != "get":
+            return None
+        return (url, tuple(sorted(parameters.items())))
+
+    def get(self, key: Optional[_CacheKey]) -> Optional[tuple[str, Response[Any]]]:
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        key: Optional[_CacheKey],
+        status: int,
+        etag: Optional[str],
+        response: Response[Any],
+    ):
+        # Error responses must never be replayed on a later 304.
+        if key is None or status != 200 or not etag:
+            return
+        with self._lock:
+            self._entries[key] = (etag, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+
+def _log_request(
+    logger: Logger,
+    method: str,
+    url: str,
+    header: dict[str, str],
+    parameters: dict[str, str],
+    json_body: Optional[dict[str, Any]],
+):
+    params = json_body if json_body is not None else parameters
+    logger.debug(
+        f"About to send {method} to {url} with header {header} and params {params}")
 
 
 class Omnia:
@@ -19,17 +187,70 @@ class Omnia:
         api_secret: str,
         session_id: str,
         logger: Logger = logging.getLogger(),
+        max_retries: int = RETRY_TOTAL,
+        rate_limit_per_sec: Optional[float] = None,
+        cache_size: int = RESPONSE_CACHE_SIZE,
     ):
+        """
+        Failed GET and PUT calls (HTTP 429 and 5xx, connection errors) are retried
+        up to `max_retries` times with an exponential backoff, honoring the
+        `Retry-After` header. POST calls are only retried if the connection could
+        not be established, as they create new items. If
+        `rate_limit_per_sec` is set, requests are throttled to at most that many
+        calls per second. Up to `cache_size` GET results are kept and revalidated
+        using their ETag, 0 disables this cache.
+        """
         self.domain_id = domain_id
         self.api_secret = api_secret
         self.session_id = session_id
         self.logger = logger
+        self._domain_id_enc = domain_id.encode("utf-8")
+        self._api_secret_enc = api_secret.encode("utf-8")
+        self._sig_cache: dict[str, str] = {}
+        self._resp_cache = _ResponseCache(cache_size)
+        self._base = f"{BASE_URL.rstrip('/')}/{domain_id}/"
+        self._min_interval = _min_interval(rate_limit_per_sec)
+        self._next_request_at = 0.0
+        self._throttle_lock = threading.Lock()
+        # requests (and urllib3) are imported here so importing omniapy stays
+        # cheap for users which only need the models or the async client.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._session = requests.Session()
+        self._session.headers[OMNIA_HEADER_X_REQUEST_CID] = session_id
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=max_retries,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=RETRY_METHODS,
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                ),
+            ),
+        )
+
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "Omnia":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def by_id(
         self,
         stream_type: StreamType,
         item_id: int,
-        parameters: dict[str, str] = {},
+        parameters: Optional[dict[str, str]] = None,
     ) -> Response[MediaResultItem]:
         """Return a item of a given stream type by it's id."""
         return self.call(
@@ -38,10 +259,34 @@ class Omnia:
             ApiType.MEDIA,
             "byid",
             [str(item_id)],
-            parameters,
+            parameters or _EMPTY,
             MediaResultItem,
         )
-    
+
+    def by_ids(
+        self,
+        stream_type: StreamType,
+        item_ids: list[int],
+        parameters: Optional[dict[str, str]] = None,
+        max_concurrency: int = 32,
+    ) -> list[Response[MediaResultItem]]:
+        """
+        Return multiple items of a given stream type by their ids. The requests are
+        issued concurrently (at most `max_concurrency` at a time) over the pooled
+        session. The results keep the order of `item_ids`.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}")
+        if not item_ids:
+            return []
+        workers = min(max_concurrency, len(item_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda item_id: self.by_id(stream_type, item_id, parameters),
+                item_ids,
+            ))
+
     def update(
         self,
         stream_type: StreamType,
@@ -106,7 +351,7 @@ class Omnia:
             ApiType.SYSTEM,
             "editableattributesfor",
             [stream_type.value],
-            {},
+            _EMPTY,
             EditableAttributesResponse,
         )
 
@@ -119,10 +364,15 @@ class Omnia:
         args: list[str],
         parameters: dict[str, str],
         response_type: Type[ResponseType],
+        json_body: Optional[dict[str, Any]] = None,
     ) -> Response[ResponseType]:
-        """Generic call to the omnia API."""
+        """
+        Generic call to the omnia API. If `json_body` is given, it's sent as a JSON
+        encoded request body instead of the form encoded `parameters`.
+        """
         return self.__universal_call(
-            method, stream_type, api_type, operation, args, parameters, response_type
+            method, stream_type, api_type, operation, args, parameters, response_type,
+            json_body,
         )
 
     def __universal_call(
@@ -134,50 +384,41 @@ class Omnia:
         args: list[str],
         parameters: dict[str, str],
         response_type: Type[ResponseType],
+        json_body: Optional[dict[str, Any]],
     ) -> Response[ResponseType]:
-        args_str = "/".join(args)
-        url: str = ""
-        if api_type is ApiType.MEDIA:
-            url = self.__url_builder(
-                BASE_URL, self.domain_id, stream_type.value, operation, args_str)
-        elif api_type is ApiType.MANAGEMENT:
-            url = self.__url_builder(
-                BASE_URL, self.domain_id, "manage", stream_type.value, args_str, operation)
-        elif api_type is ApiType.UPLOAD_LINK_MANAGEMENT:
-            url = self.__url_builder(
-                BASE_URL, self.domain_id, "manage", "uploadlinks", operation)
-        elif api_type is ApiType.SYSTEM:
-            url = self.__url_builder(
-                BASE_URL, self.domain_id, "system", operation, args_str)
-        header = self.__request_header(
-            operation, self.domain_id, self.api_secret, self.session_id)
-        self.logger.debug(
-            f"About to send {method} to {url} with header {header} and params {parameters}")
-        result = requests.request(
+        url = _build_url(self._base, api_type, stream_type, operation, args)
+        header = _request_header(
+            self._sig_cache, operation, self._domain_id_enc, self._api_secret_enc)
+        body = _request_body(header, parameters, json_body)
+        # GET results are cached along with their ETag. On a repeated call the
+        # server is asked to revalidate the ETag and the already parsed response
+        # is reused if nothing changed.
+        cache_key = self._resp_cache.key(method, url, parameters)
+        cached = self._resp_cache.get(cache_key)
+        if cached is not None:
+            header["If-None-Match"] = cached[0]
+        _log_request(self.logger, method, url, header, parameters, json_body)
+        self.__throttle()
+        result = self._session.request(
             method,
-            headers=header,
             url=url,
-            data=parameters,
+            headers=header,
+            data=body,
         )
-        return Response[response_type].model_validate(result.json())
-
-    def __request_header(
-        self,
-        operation: str,
-        domain_id: str,
-        api_secret: str,
-        session_id: str,
-    ) -> dict[str, str]:
-        signature = hashlib.md5(
-            f"{operation}{domain_id}{api_secret}".encode("utf-8"))
-        return {
-            OMNIA_HEADER_X_REQUEST_CID: session_id,
-            OMNIA_HEADER_X_REQUEST_TOKEN: signature.hexdigest(),
-        }
+        if cached is not None and result.status_code == 304:
+            return cached[1]
+        response = _response_class(response_type).model_validate_json(result.content)
+        self._resp_cache.put(
+            cache_key, result.status_code, result.headers.get("ETag"), response)
+        return response
 
-    @staticmethod
-    def __url_builder(*args) -> str:
-        rsl: list[str] = []
-        for arg in args:
-            rsl.append(str(arg).lstrip("/").rstrip("/"))
-        return "/".join(rsl)
+    def __throttle(self):
+        if self._min_interval is None:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            if wait > 0:
+                time.sleep(wait)
+                now += wait
+            self._next_request_at = now + self._min_interval
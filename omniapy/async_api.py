@@ -0,0 +1,310 @@
+import logging
+from .api import (
+    BASE_URL,
+    OMNIA_HEADER_X_REQUEST_CID,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
+    RESPONSE_CACHE_SIZE,
+    RETRY_TOTAL,
+    _EMPTY,
+    _ResponseCache,
+    _build_url,
+    _log_request,
+    _min_interval,
+    _request_body,
+    _request_header,
+    _response_class,
+)
+from .model import ApiType, EditableAttributesResponse, MediaResultItem, Response, ResponseType, StreamType
+
+import asyncio
+import time
+from logging import Logger
+from typing import Any, Optional, Type
+
+import aiohttp
+
+RATE_LIMIT_REMAINING_HEADER: str = "X-RateLimit-Remaining"
+RETRY_AFTER_HEADER: str = "Retry-After"
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    """Returns the `Retry-After` header in seconds, if present and numeric."""
+    value = headers.get(RETRY_AFTER_HEADER)
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+class AsyncOmnia:
+    """
+    Asynchronous variant of `Omnia` using aiohttp. Allows to issue multiple
+    calls concurrently (e.g. using `asyncio.gather`). Requires the optional
+    `aiohttp` dependency.
+    """
+
+    def __init__(
+        self,
+        domain_id: str,
+        api_secret: str,
+        session_id: str,
+        logger: Logger = logging.getLogger(),
+        max_retries: int = RETRY_TOTAL,
+        rate_limit_per_sec: Optional[float] = None,
+        cache_size: int = RESPONSE_CACHE_SIZE,
+    ):
+        """
+        Failed GET and PUT calls (HTTP 429 and 5xx, connection errors) are retried
+        up to `max_retries` times with an exponential backoff, honoring the
+        `Retry-After` header. POST calls are only retried if the connection could
+        not be established, as they create new items. If
+        `rate_limit_per_sec` is set, requests are throttled to at most that many
+        calls per second. Once the API reports an exhausted rate limit (via
+        `X-RateLimit-Remaining`) further requests are held back until it resets.
+        Up to `cache_size` GET results are kept and revalidated using their ETag,
+        0 disables this cache.
+        """
+        self.domain_id = domain_id
+        self.api_secret = api_secret
+        self.session_id = session_id
+        self.logger = logger
+        self._domain_id_enc = domain_id.encode("utf-8")
+        self._api_secret_enc = api_secret.encode("utf-8")
+        self._sig_cache: dict[str, str] = {}
+        self._resp_cache = _ResponseCache(cache_size)
+        self._base = f"{BASE_URL.rstrip('/')}/{domain_id}/"
+        self._max_retries = max_retries
+        self._min_interval = _min_interval(rate_limit_per_sec)
+        self._next_request_at = 0.0
+        self._throttle_lock = asyncio.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        # The session is created lazily as aiohttp expects it to be set up
+        # within a running event loop.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=64, keepalive_timeout=30),
+                headers={OMNIA_HEADER_X_REQUEST_CID: self.session_id},
+            )
+        return self._session
+
+    async def aclose(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncOmnia":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def by_id(
+        self,
+        stream_type: StreamType,
+        item_id: int,
+        parameters: Optional[dict[str, str]] = None,
+    ) -> Response[MediaResultItem]:
+        """Return a item of a given stream type by it's id."""
+        return await self.call(
+            "get",
+            stream_type,
+            ApiType.MEDIA,
+            "byid",
+            [str(item_id)],
+            parameters or _EMPTY,
+            MediaResultItem,
+        )
+
+    async def by_ids(
+        self,
+        stream_type: StreamType,
+        item_ids: list[int],
+        parameters: Optional[dict[str, str]] = None,
+        max_concurrency: int = 32,
+    ) -> list[Response[MediaResultItem]]:
+        """
+        Return multiple items of a given stream type by their ids. The requests are
+        issued concurrently (at most `max_concurrency` at a time). The results keep
+        the order of `item_ids`.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(item_id: int) -> Response[MediaResultItem]:
+            async with semaphore:
+                return await self.by_id(stream_type, item_id, parameters)
+
+        return list(await asyncio.gather(*(fetch(item_id) for item_id in item_ids)))
+
+    async def update(
+        self,
+        stream_type: StreamType,
+        item_id: int,
+        parameters: dict[str, str],
+    ) -> Response[Any]:
+        """
+        Will update the general Metadata of a Media Item. Uses the Management API.
+        """
+        return await self.call(
+            "put",
+            stream_type,
+            ApiType.MANAGEMENT,
+            "update",
+            [str(item_id)],
+            parameters,
+            Any,
+        )
+
+    async def upload_by_url(
+        self,
+        stream_type: StreamType,
+        url: str,
+        use_queue: bool,
+        filename: Optional[str] = None,
+    ) -> Response[Any]:
+        """
+        will create a new Media Item of the given Streamtype, if the given
+        urlParameter contains a valid Source for the given Streamtype.
+        """
+        data = {
+            "url": url,
+            "useQueue": 1 if use_queue else 0,
+        }
+        if filename:
+            data["filename"] = filename
+        return await self.call(
+            "post",
+            stream_type,
+            ApiType.MANAGEMENT,
+            "fromurl",
+            [],
+            data,
+            Any,
+        )
+
+    async def editable_attributes(
+        self,
+        stream_type: StreamType,
+    ) -> Response[EditableAttributesResponse]:
+        """
+        Lists all editable attributes for a given stream type. See
+        `Omnia.editable_attributes` for details.
+        """
+        return await self.call(
+            "get",
+            stream_type,
+            ApiType.SYSTEM,
+            "editableattributesfor",
+            [stream_type.value],
+            _EMPTY,
+            EditableAttributesResponse,
+        )
+
+    async def call(
+        self,
+        method: str,
+        stream_type: StreamType,
+        api_type: ApiType,
+        operation: str,
+        args: list[str],
+        parameters: dict[str, str],
+        response_type: Type[ResponseType],
+        json_body: Optional[dict[str, Any]] = None,
+    ) -> Response[ResponseType]:
+        """
+        Generic call to the omnia API. If `json_body` is given, it's sent as a JSON
+        encoded request body instead of the form encoded `parameters`.
+        """
+        return await self.__universal_call(
+            method, stream_type, api_type, operation, args, parameters, response_type,
+            json_body,
+        )
+
+    async def __universal_call(
+        self,
+        method: str,
+        stream_type: StreamType,
+        api_type: ApiType,
+        operation: str,
+        args: list[str],
+        parameters: dict[str, str],
+        response_type: Type[ResponseType],
+        json_body: Optional[dict[str, Any]],
+    ) -> Response[ResponseType]:
+        url = _build_url(self._base, api_type, stream_type, operation, args)
+        header = _request_header(
+            self._sig_cache, operation, self._domain_id_enc, self._api_secret_enc)
+        body = _request_body(header, parameters, json_body)
+        # See `Omnia` for the ETag based caching of GET results.
+        cache_key = self._resp_cache.key(method, url, parameters)
+        cached = self._resp_cache.get(cache_key)
+        if cached is not None:
+            header["If-None-Match"] = cached[0]
+        _log_request(self.logger, method, url, header, parameters, json_body)
+        session = self.__get_session()
+        retryable = method.upper() in RETRY_METHODS
+        attempt = 0
+        while True:
+            await self.__throttle()
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=header,
+                    data=body,
+                ) as result:
+                    retry_after = _retry_after(result.headers)
+                    if result.headers.get(RATE_LIMIT_REMAINING_HEADER) == "0":
+                        self._next_request_at = max(
+                            self._next_request_at,
+                            time.monotonic() + (retry_after or 1.0),
+                        )
+                    if (
+                        not retryable
+                        or result.status not in RETRY_STATUS_CODES
+                        or attempt >= self._max_retries
+                    ):
+                        if cached is not None and result.status == 304:
+                            return cached[1]
+                        status = result.status
+                        etag = result.headers.get("ETag")
+                        content = await result.read()
+                        break
+                    reason = f"status {result.status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Like urllib3 for the sync client: a failed connect never reached
+                # the server and is safe to retry for every method.
+                connect_failed = isinstance(e, aiohttp.ClientConnectorError)
+                if not (retryable or connect_failed) or attempt >= self._max_retries:
+                    raise
+                retry_after = None
+                reason = repr(e)
+            delay = retry_after
+            if delay is None:
+                delay = RETRY_BACKOFF_FACTOR * 2 ** attempt
+            self.logger.debug(f"Got {reason} from {url}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+        response = _response_class(response_type).model_validate_json(content)
+        self._resp_cache.put(cache_key, status, etag, response)
+        return response
+
+    async def __throttle(self):
+        async with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now += wait
+            if self._min_interval is not None:
+                self._next_request_at = now + self._min_interval
@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Any, Generic, Optional, TypeVar
 
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 
 
 class Bool(int, Enum):
@@ -69,8 +69,7 @@ class ResponseMetadata(BaseModel):
     from_cache: Optional[int] = Field(None, alias="fromcache")
     """States whether result came from cache"""
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
 
 class ResponsePaging(BaseModel):
@@ -83,8 +82,7 @@ class ResponsePaging(BaseModel):
     result_count: int = Field(alias="resultcount")
     """The maximally available Number of Items."""
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
 
 class MediaResultGeneral(BaseModel):
@@ -95,6 +93,8 @@ class MediaResultGeneral(BaseModel):
     Some fields (like Channel) are optional (or as omnia calls them »additional«)
     fields. You have to use the »additionalFields« parameter for the request.
     """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     item_id: int = Field(alias="ID")
     gid: int = Field(alias="GID")
     hash_value: str = Field(alias="hash")
@@ -114,6 +114,8 @@ class MediaResultGeneral(BaseModel):
 
 
 class ManagementResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str
 
 
@@ -121,6 +123,8 @@ class MediaResultItem(BaseModel):
     """
     MediaResultItem holds detailed information about a single media result item.
     """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     general: MediaResultGeneral = Field(alias="general")
     # image_data: MediaResultImageData = Field(alias="imagedata")
     image_data: Any = Field(alias="imagedata")
@@ -133,6 +137,8 @@ class MediaResult(RootModel):
     `MediaResultItem`s was made to ease the further work with results outside
     this package.
     """
+    model_config = ConfigDict(frozen=True)
+
     root: list[MediaResultItem]
 
 
@@ -141,6 +147,8 @@ class EditableAttributesProperties(BaseModel):
     EditableAttributesResponse is a map that associates attribute names with their
     editable properties.
     """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     attrib_type: str = Field(alias="type")
     max_length: Optional[int] = Field(None, alias="maxlength")
     attrib_format: Optional[str] = Field(None, alias="format")
@@ -153,6 +161,8 @@ class EditableAttributesResponse(RootModel):
     EditableAttributesResponse is a map that associates attribute names with their
     editable properties.
     """
+    model_config = ConfigDict(frozen=True)
+
     root: dict[str, EditableAttributesProperties]
 
 
@@ -164,7 +174,15 @@ class Response(BaseModel, Generic[ResponseType]):
     Response represents the response structure obtained from a nexxOmnia
     API call. It encapsulates the metadata, result, and paging information
     as documented here https://api.docs.nexx.cloud/api-design/response-object.
+
+    Responses of GET calls are cached by the clients and the same instance is
+    returned to every caller on a cache hit. The models are frozen, but untyped
+    values (like `MediaResultItem.image_data`) and the containers of root models
+    are plain lists and dicts. Treat them as read-only and copy them
+    (`model_copy(deep=True)`) before making changes.
     """
+    model_config = ConfigDict(frozen=True)
+
     metadata: ResponseMetadata
     result: Optional[ResponseType] = None
     paging: Optional[ResponsePaging] = None
@@ -0,0 +1,105 @@
+import json
+
+import requests
+from requests.adapters import BaseAdapter
+
+from omniapy import Omnia, StreamType
+
+
+def media_body(title: str = "title", status: int = 200) -> bytes:
+    return json.dumps({
+        "metadata": {"status": status, "verb": "GET", "processingtime": 0.01},
+        "result": {
+            "general": {
+                "ID": 1,
+                "GID": 2,
+                "hash": "hash",
+                "title": title,
+                "subtitle": "",
+                "contentModerationAspects": "",
+                "created": "2024-01-01T00:00:00",
+                "isPay": 0,
+            },
+            "imagedata": {},
+        },
+    }).encode("utf-8")
+
+
+class StubAdapter(BaseAdapter):
+    """Transport returning canned `(status, headers, body)` responses in order."""
+
+    def __init__(self, responses: list[tuple[int, dict[str, str], bytes]]):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, headers, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = body
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def stub_client(responses, **kwargs) -> tuple[Omnia, StubAdapter]:
+    client = Omnia("1234", "secret", "session", **kwargs)
+    adapter = StubAdapter(responses)
+    client._session.mount("https://", adapter)
+    return client, adapter
+
+
+def test_by_id_returns_cached_response_on_304():
+    client, adapter = stub_client([
+        (200, {"ETag": '"v1"'}, media_body()),
+        (304, {"ETag": '"v1"'}, b""),
+    ])
+    first = client.by_id(StreamType.VIDEO, 1)
+    second = client.by_id(StreamType.VIDEO, 1)
+
+    assert second is first
+    assert "If-None-Match" not in adapter.requests[0].headers
+    assert adapter.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_error_responses_are_not_cached():
+    client, adapter = stub_client([
+        (500, {"ETag": '"err"'}, media_body(status=500)),
+        (200, {"ETag": '"v1"'}, media_body()),
+    ])
+    client.by_id(StreamType.VIDEO, 1)
+    client.by_id(StreamType.VIDEO, 1)
+
+    assert "If-None-Match" not in adapter.requests[1].headers
+
+
+def test_cache_evicts_least_recently_used():
+    client, adapter = stub_client([
+        (200, {"ETag": '"a"'}, media_body()),
+        (200, {"ETag": '"b"'}, media_body()),
+        (200, {"ETag": '"c"'}, media_body()),
+        (200, {"ETag": '"a2"'}, media_body()),
+    ], cache_size=2)
+    for item_id in (1, 2, 3, 1):
+        client.by_id(StreamType.VIDEO, item_id)
+
+    assert "If-None-Match" not in adapter.requests[3].headers
+
+
+def test_cache_size_zero_disables_cache():
+    client, adapter = stub_client([
+        (200, {"ETag": '"v1"'}, media_body("first")),
+        (200, {"ETag": '"v1"'}, media_body("second")),
+    ], cache_size=0)
+    client.by_id(StreamType.VIDEO, 1)
+    second = client.by_id(StreamType.VIDEO, 1)
+
+    assert "If-None-Match" not in adapter.requests[1].headers
+    assert second.result is not None
+    assert second.result.general.title == "second"
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Union
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from multidict import CIMultiDict  # noqa: E402
+
+from omniapy import StreamType  # noqa: E402
+from omniapy.async_api import AsyncOmnia  # noqa: E402
+
+from .test_api import media_body  # noqa: E402
+
+
+class StubResponse:
+    def __init__(self, status: int, headers: dict[str, str], body: bytes):
+        self.status = status
+        self.headers = CIMultiDict(headers)
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self) -> "StubResponse":
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class StubSession:
+    """
+    Stands in for `aiohttp.ClientSession`, answering with canned
+    `(status, headers, body)` tuples or raising the given exceptions in order.
+    """
+
+    closed = False
+
+    def __init__(self, responses: list[Union[tuple[int, dict[str, str], bytes], Exception]]):
+        self.responses = list(responses)
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+
+    def request(self, method: str, url: str, headers: dict[str, str], data: Any):
+        self.requests.append((method, url, dict(headers)))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return StubResponse(*response)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def stub_client(responses, **kwargs) -> tuple[AsyncOmnia, StubSession]:
+    client = AsyncOmnia("1234", "secret", "session", **kwargs)
+    session = StubSession(responses)
+    client._session = session  # type: ignore[assignment]
+    return client, session
+
+
+def test_retries_with_backoff_and_retry_after(sleeps):
+    client, session = stub_client([
+        (503, {}, b""),
+        (429, {"Retry-After": "2"}, b""),
+        (200, {}, media_body()),
+    ])
+    response = asyncio.run(client.by_id(StreamType.VIDEO, 1))
+
+    assert response.metadata.status == 200
+    assert len(session.requests) == 3
+    assert sleeps == [0.3, 2.0]
+
+
+def test_gives_up_after_max_retries(sleeps):
+    client, session = stub_client(
+        [(503, {}, media_body(status=503))] * 3, max_retries=2)
+    response = asyncio.run(client.by_id(StreamType.VIDEO, 1))
+
+    assert response.metadata.status == 503
+    assert len(session.requests) == 3
+
+
+def test_post_is_not_retried_on_server_errors(sleeps):
+    client, session = stub_client([(502, {}, media_body(status=502))])
+    response = asyncio.run(
+        client.upload_by_url(StreamType.VIDEO, "https://example.com/a.mp4", False))
+
+    assert response.metadata.status == 502
+    assert len(session.requests) == 1
+    assert sleeps == []
+
+
+def test_retries_connection_errors(sleeps):
+    client, session = stub_client([
+        aiohttp.ServerDisconnectedError(),
+        (200, {}, media_body()),
+    ])
+    asyncio.run(client.by_id(StreamType.VIDEO, 1))
+
+    assert len(session.requests) == 2
+
+
+def test_exhausted_rate_limit_delays_next_request(sleeps):
+    client, _ = stub_client([
+        (200, {"X-RateLimit-Remaining": "0", "Retry-After": "5"}, media_body()),
+        (200, {}, media_body()),
+    ])
+
+    async def run():
+        await client.by_id(StreamType.VIDEO, 1)
+        await client.by_id(StreamType.VIDEO, 2)
+
+    asyncio.run(run())
+
+    assert len(sleeps) == 1
+    assert 4 < sleeps[0] <= 5
+
+
+def test_by_id_returns_cached_response_on_304(sleeps):
+    client, session = stub_client([
+        (200, {"ETag": '"v1"'}, media_body()),
+        (304, {}, b""),
+    ])
+
+    async def run():
+        return (
+            await client.by_id(StreamType.VIDEO, 1),
+            await client.by_id(StreamType.VIDEO, 1),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert second is first
+    assert session.requests[1][2]["If-None-Match"] == '"v1"'
+
+
+def test_rejects_non_positive_rate_limit():
+    with pytest.raises(ValueError):
+        AsyncOmnia("1234", "secret", "session", rate_limit_per_sec=0)